@@ -1,6 +1,7 @@
 import asyncio
 import os
 import typing
+from dataclasses import dataclass
 
 from ..functions.ext.asgi import Application
 from ._config import AppConfig
@@ -10,8 +11,14 @@ from ._process import kill_process_by_port
 if typing.TYPE_CHECKING:
     from ._uvicorn_util import AwaitableUvicornServer
 
+
+@dataclass
+class _UdfServerState:
+    running_server: 'typing.Optional[AwaitableUvicornServer]' = None
+
+
 # Keep track of currently running server
-_running_server: 'typing.Optional[AwaitableUvicornServer]' = None
+_default_state = _UdfServerState()
 
 # Maximum number of UDFs allowed
 MAX_UDFS_LIMIT = 10
@@ -20,8 +27,8 @@ MAX_UDFS_LIMIT = 10
 async def run_udf_app(
     log_level: str = 'error',
     kill_existing_app_server: bool = True,
+    _state: _UdfServerState = _default_state,
 ) -> UdfConnectionInfo:
-    global _running_server
     from ._uvicorn_util import AwaitableUvicornServer
 
     try:
@@ -35,9 +42,9 @@ async def run_udf_app(
         # Shutdown the server gracefully if it was started by us.
         # Since the uvicorn server doesn't start a new subprocess
         # killing the process would result in kernel dying.
-        if _running_server is not None:
-            await _running_server.shutdown()
-            _running_server = None
+        if _state.running_server is not None:
+            await _state.running_server.shutdown()
+            _state.running_server = None
 
         # Kill if any other process is occupying the port
         kill_process_by_port(app_config.listen_port)
@@ -72,9 +79,10 @@ async def run_udf_app(
     if app_config.running_interactively:
         app.register_functions(replace=True)
 
-    _running_server = AwaitableUvicornServer(config)
-    asyncio.create_task(_running_server.serve())
-    await _running_server.wait_for_startup()
+    server = AwaitableUvicornServer(config)
+    _state.running_server = server
+    asyncio.create_task(server.serve())
+    await server.wait_for_startup()
 
     print(f'Python UDF registered at {base_url}')
 